@@ -2918,3 +2918,21 @@ class InvoiceTest(StripeTestCase):
         invoice_plans_as_needed(self.next_month)
         plan = CustomerPlan.objects.first()
         self.assertEqual(plan.next_invoice_date, self.next_month + timedelta(days=29))
+
+    def test_invoice_plans_as_needed_defaults_to_now(self) -> None:
+        with patch("corporate.lib.stripe.timezone_now", return_value=self.now):
+            self.local_upgrade(self.seat_count, True, CustomerPlan.ANNUAL, "token")
+        plan = CustomerPlan.objects.first()
+        self.assertEqual(plan.next_invoice_date, self.next_month)
+        # Test nothing needed to be done
+        with patch(
+            "corporate.lib.stripe.timezone_now", return_value=self.next_month - timedelta(days=1)
+        ), patch("corporate.lib.stripe.invoice_plan") as mocked:
+            invoice_plans_as_needed()
+        mocked.assert_not_called()
+        # Test something needing to be done
+        with patch("corporate.lib.stripe.timezone_now", return_value=self.next_month), patch(
+            "corporate.lib.stripe.invoice_plan"
+        ) as mocked:
+            invoice_plans_as_needed()
+        mocked.assert_called_once_with(plan, self.next_month)
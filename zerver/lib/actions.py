@@ -480,10 +480,12 @@ def process_new_human_user(
     if len(streams) == 0:
         streams = get_default_subs(user_profile)
 
+    stream_ids = {stream.id for stream in streams}
     for default_stream_group in default_stream_groups:
         default_stream_group_streams = default_stream_group.streams.all()
         for stream in default_stream_group_streams:
-            if stream not in streams:
+            if stream.id not in stream_ids:
+                stream_ids.add(stream.id)
                 streams.append(stream)
 
     bulk_add_subscriptions(
@@ -1894,7 +1896,9 @@ def do_send_messages(
         if send_request.message.is_stream_message():
             if send_request.stream is None:
                 stream_id = send_request.message.recipient.type_id
-                send_request.stream = Stream.objects.select_related().get(id=stream_id)
+                # We only need the stream's own columns below, so skip
+                # joining in (and instantiating) its realm.
+                send_request.stream = Stream.objects.get(id=stream_id)
             # assert needed because stubs for django are missing
             assert send_request.stream is not None
             realm_id = send_request.stream.realm_id
@@ -2100,12 +2104,20 @@ def create_user_messages(
     return user_messages
 
 
+BULK_INSERT_UMS_PAGE_SIZE = 10000
+
+
 def bulk_insert_ums(ums: List[UserMessageLite]) -> None:
     """
     Doing bulk inserts this way is much faster than using Django,
     since we don't have any ORM overhead.  Profiling with 1000
     users shows a speedup of 0.436 -> 0.027 seconds, so we're
     talking about a 15x speedup.
+
+    We send up to BULK_INSERT_UMS_PAGE_SIZE rows per INSERT statement,
+    rather than execute_values' default of 100, so that fanning a
+    message out to a large stream costs a single database round trip
+    in all but the most extreme cases.
     """
     if not ums:
         return
@@ -2120,7 +2132,7 @@ def bulk_insert_ums(ums: List[UserMessageLite]) -> None:
     )
 
     with connection.cursor() as cursor:
-        execute_values(cursor.cursor, query, vals)
+        execute_values(cursor.cursor, query, vals, page_size=BULK_INSERT_UMS_PAGE_SIZE)
 
 
 def do_add_submessage(
@@ -4757,7 +4769,9 @@ def do_remove_default_stream_group(realm: Realm, group: DefaultStreamGroup) -> N
 def get_default_streams_for_realm(realm_id: int) -> List[Stream]:
     return [
         default.stream
-        for default in DefaultStream.objects.select_related().filter(realm_id=realm_id)
+        for default in DefaultStream.objects.select_related("stream", "stream__realm").filter(
+            realm_id=realm_id
+        )
     ]
 
 
@@ -5178,7 +5192,7 @@ def do_update_message_flags(
     # searching your personal history.  So we need to create one.  We
     # add UserMessage.flags.historical, so that features that need
     # "messages you actually received" can exclude these UserMessages.
-    if msgs.count() == 0:
+    if not msgs.exists():
         if not len(messages) == 1:
             raise JsonableError(_("Invalid message(s)"))
         if flag != "starred":
@@ -6680,7 +6694,7 @@ def do_remove_realm_domain(
     realm = realm_domain.realm
     domain = realm_domain.domain
     realm_domain.delete()
-    if RealmDomain.objects.filter(realm=realm).count() == 0 and realm.emails_restricted_to_domains:
+    if not RealmDomain.objects.filter(realm=realm).exists() and realm.emails_restricted_to_domains:
         # If this was the last realm domain, we mark the realm as no
         # longer restricted to domain, because the feature doesn't do
         # anything if there are no domains, and this is probably less
@@ -1,4 +1,5 @@
 import hashlib
+from functools import lru_cache
 
 from django.conf import settings
 
@@ -6,6 +7,9 @@ from zerver.lib.utils import make_safe_digest
 from zerver.models import UserProfile
 
 
+# Message payloads compute the sender's avatar URL for every message,
+# so memoize this, since a batch of messages usually has few senders.
+@lru_cache(maxsize=8192)
 def gravatar_hash(email: str) -> str:
     """Compute the Gravatar hash for an email address."""
     # Non-ASCII characters aren't permitted by the currently active e-mail
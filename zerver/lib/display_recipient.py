@@ -39,6 +39,14 @@ def get_display_recipient_remote_cache(
         stream = Stream.objects.values("name").get(id=recipient_type_id)
         return stream["name"]
 
+    if recipient_type == Recipient.PERSONAL:
+        # A personal recipient's only subscriber is the user whose id
+        # is its type_id, so we can skip joining through Subscription.
+        assert recipient_type_id is not None
+        return list(
+            UserProfile.objects.filter(id=recipient_type_id).values(*display_recipient_fields)
+        )
+
     # The main priority for ordering here is being deterministic.
     # Right now, we order by ID, which matches the ordering of user
     # names in the left sidebar.
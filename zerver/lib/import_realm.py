@@ -1186,8 +1186,7 @@ def do_import_realm(import_dir: Path, subdomain: str, processes: int = 1) -> Rea
 
     # Similarly, we need to recalculate the first_message_id for stream objects.
     for stream in Stream.objects.filter(realm=realm):
-        recipient = Recipient.objects.get(type=Recipient.STREAM, type_id=stream.id)
-        first_message = Message.objects.filter(recipient=recipient).first()
+        first_message = Message.objects.filter(recipient_id=stream.recipient_id).first()
         if first_message is None:
             stream.first_message_id = None
         else:
@@ -1233,7 +1232,7 @@ def create_users(
 ) -> None:
     user_set = set()
     for full_name, email in name_list:
-        if not UserProfile.objects.filter(email=email):
+        if not UserProfile.objects.filter(email=email).exists():
             user_set.add((email, full_name, True))
     bulk_create_users(realm, user_set, bot_type)
 
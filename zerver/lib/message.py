@@ -353,6 +353,24 @@ class MessageDict:
         # Near duplicate of the build_message_dict + get_raw_db_rows
         # code path that accepts already fetched Message objects
         # rather than message IDs.
+        #
+        # Callers should fetch the messages with select_related(), so
+        # that the sender, recipient, and sending_client accesses
+        # below don't each do a database query per message.
+
+        stream_realm_ids: Dict[int, int] = {}
+        if realm_id is None:
+            # Fetch the realms of all the streams involved in a
+            # single query, rather than one query per stream message.
+            stream_ids = {
+                message.recipient.type_id
+                for message in messages
+                if message.recipient.type == Recipient.STREAM
+            }
+            if stream_ids:
+                stream_realm_ids = dict(
+                    Stream.objects.filter(id__in=stream_ids).values_list("id", "realm_id")
+                )
 
         def get_rendering_realm_id(message: Message) -> int:
             # realm_id can differ among users, currently only possible
@@ -360,7 +378,7 @@ class MessageDict:
             if realm_id is not None:
                 return realm_id
             if message.recipient.type == Recipient.STREAM:
-                return Stream.objects.get(id=message.recipient.type_id).realm_id
+                return stream_realm_ids[message.recipient.type_id]
             return message.sender.realm_id
 
         message_rows = [
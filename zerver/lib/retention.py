@@ -356,7 +356,11 @@ def delete_messages(msg_ids: List[int]) -> None:
     # key to Message (due to `on_delete=CASCADE` in our models
     # configuration), so we need to be sure we've taken care of
     # archiving the messages before doing this step.
-    Message.objects.filter(id__in=msg_ids).delete()
+    #
+    # Django's deletion collector loads the messages into Python to
+    # handle those cascades; it only needs their ids for that, so we
+    # avoid fetching the (potentially large) content columns.
+    Message.objects.filter(id__in=msg_ids).only("id").delete()
 
 
 def delete_expired_attachments(realm: Realm) -> None:
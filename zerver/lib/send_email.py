@@ -23,7 +23,8 @@ from django.utils.translation import override as override_language
 from confirmation.models import generate_key
 from scripts.setup.inline_email_css import inline_template
 from zerver.lib.logging_util import log_to_file
-from zerver.models import EMAIL_TYPES, Realm, ScheduledEmail, UserProfile, get_user_profile_by_id
+from zerver.lib.users import bulk_get_users_by_id
+from zerver.models import EMAIL_TYPES, Realm, ScheduledEmail, UserProfile
 
 ## Logging setup ##
 
@@ -74,7 +75,12 @@ def build_email(
     # Callers should pass exactly one of to_user_id and to_email.
     assert (to_user_ids is None) ^ (to_emails is None)
     if to_user_ids is not None:
-        to_users = [get_user_profile_by_id(to_user_id) for to_user_id in to_user_ids]
+        # Fetch all the recipients with a single remote cache round
+        # trip, rather than one get_user_profile_by_id call per user.
+        to_users_by_id = bulk_get_users_by_id(to_user_ids)
+        if any(to_user_id not in to_users_by_id for to_user_id in to_user_ids):
+            raise UserProfile.DoesNotExist("UserProfile matching query does not exist.")
+        to_users = [to_users_by_id[to_user_id] for to_user_id in to_user_ids]
         if realm is None:
             assert len({to_user.realm_id for to_user in to_users}) == 1
             realm = to_users[0].realm
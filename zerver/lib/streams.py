@@ -553,11 +553,8 @@ def filter_stream_authorization(
 
         unauthorized_streams.append(stream)
 
-    authorized_streams = [
-        stream
-        for stream in streams
-        if stream.id not in {stream.id for stream in unauthorized_streams}
-    ]
+    unauthorized_stream_ids = {stream.id for stream in unauthorized_streams}
+    authorized_streams = [stream for stream in streams if stream.id not in unauthorized_stream_ids]
     return authorized_streams, unauthorized_streams
 
 
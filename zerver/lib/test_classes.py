@@ -69,6 +69,7 @@ from zerver.lib.test_helpers import find_key_by_email, instrument_url
 from zerver.lib.users import get_api_key
 from zerver.lib.validator import check_string
 from zerver.lib.webhooks.common import get_fixture_http_headers, standardize_headers
+from zerver.lib.zephyr import get_hesiod_name
 from zerver.models import (
     Client,
     Message,
@@ -133,6 +134,7 @@ class ZulipTestCase(TestCase):
         clear_client_event_queues_for_testing()
         clear_supported_auth_backends_cache()
         flush_per_request_caches()
+        get_hesiod_name.cache_clear()
         translation.activate(settings.LANGUAGE_CODE)
 
         # Clean up after using fakeldap in LDAP tests:
@@ -821,8 +823,7 @@ Output:
 
     def users_subscribed_to_stream(self, stream_name: str, realm: Realm) -> List[UserProfile]:
         stream = Stream.objects.get(name=stream_name, realm=realm)
-        recipient = Recipient.objects.get(type_id=stream.id, type=Recipient.STREAM)
-        subscriptions = Subscription.objects.filter(recipient=recipient, active=True)
+        subscriptions = Subscription.objects.filter(recipient_id=stream.recipient_id, active=True)
 
         return [subscription.user_profile for subscription in subscriptions]
 
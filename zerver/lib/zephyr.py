@@ -1,16 +1,27 @@
 import re
 import traceback
+from functools import lru_cache
 
 import DNS
 
+# Matches either e.g. username@mit.edu or user|CROSSREALM.INVALID@mit.edu
+MIT_EMAIL_RE = re.compile(r"^([a-zA-Z0-9_.-]+)(\|.+)?@mit\.edu$")
+
+
+# Hesiod names effectively never change, and the zephyr mirror looks
+# up the same handful of users over and over, so we cache successful
+# lookups in-process.  Failed lookups raise, so they aren't cached.
+@lru_cache(maxsize=4096)
+def get_hesiod_name(username: str) -> str:
+    answer = DNS.dnslookup(f"{username}.passwd.ns.athena.mit.edu", DNS.Type.TXT)
+    return answer[0][0].split(":")[4].split(",")[0].strip()
+
 
 def compute_mit_user_fullname(email: str) -> str:
     try:
-        # Input is either e.g. username@mit.edu or user|CROSSREALM.INVALID@mit.edu
-        match_user = re.match(r"^([a-zA-Z0-9_.-]+)(\|.+)?@mit\.edu$", email.lower())
+        match_user = MIT_EMAIL_RE.match(email.lower())
         if match_user and match_user.group(2) is None:
-            answer = DNS.dnslookup(f"{match_user.group(1)}.passwd.ns.athena.mit.edu", DNS.Type.TXT)
-            hesiod_name = answer[0][0].split(":")[4].split(",")[0].strip()
+            hesiod_name = get_hesiod_name(match_user.group(1))
             if hesiod_name != "":
                 return hesiod_name
         elif match_user:
@@ -0,0 +1,20 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("zerver", "0320_realm_move_messages_between_streams_policy"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="message",
+            index=models.Index(
+                fields=["recipient", "date_sent"],
+                name="zerver_message_recipient_id_date_sent_idx",
+            ),
+        ),
+    ]
@@ -138,10 +138,11 @@ def get_display_recipient_by_id(
     # Have to import here, to avoid circular dependency.
     from zerver.lib.display_recipient import get_display_recipient_remote_cache
 
-    if recipient_id not in per_request_display_recipient_cache:
+    result = per_request_display_recipient_cache.get(recipient_id)
+    if result is None:
         result = get_display_recipient_remote_cache(recipient_id, recipient_type, recipient_type_id)
         per_request_display_recipient_cache[recipient_id] = result
-    return per_request_display_recipient_cache[recipient_id]
+    return result
 
 
 def get_display_recipient(recipient: "Recipient") -> DisplayRecipientT:
@@ -2054,9 +2055,8 @@ def bulk_get_streams(realm: Realm, stream_names: STREAM_NAMES) -> Dict[str, Any]
 def get_huddle_recipient(user_profile_ids: Set[int]) -> Recipient:
 
     # The caller should ensure that user_profile_ids includes
-    # the sender.  Note that get_huddle hits the cache, and then
-    # we hit another cache to get the recipient.  We may want to
-    # unify our caching strategy here.
+    # the sender.  Note that get_huddle hits the cache, and the
+    # cached Huddle object already has its recipient populated.
     huddle = get_huddle(list(user_profile_ids))
     return huddle.recipient
 
@@ -2174,6 +2174,16 @@ class ArchivedMessage(AbstractMessage):
 class Message(AbstractMessage):
     id: int = models.AutoField(auto_created=True, primary_key=True, verbose_name="ID")
 
+    class Meta:
+        indexes = [
+            # Supports fetching recent messages in a set of streams,
+            # e.g. for digests and new users' initial history.
+            models.Index(
+                fields=("recipient", "date_sent"),
+                name="zerver_message_recipient_id_date_sent_idx",
+            ),
+        ]
+
     def topic_name(self) -> str:
         """
         Please start using this helper to facilitate an
@@ -2604,7 +2614,7 @@ class Attachment(AbstractAttachment):
     messages: Manager = models.ManyToManyField(Message)
 
     def is_claimed(self) -> bool:
-        return self.messages.count() > 0
+        return self.messages.exists()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -2980,7 +2990,12 @@ def get_huddle(id_list: List[int]) -> Huddle:
 )
 def get_huddle_backend(huddle_hash: str, id_list: List[int]) -> Huddle:
     with transaction.atomic():
-        (huddle, created) = Huddle.objects.get_or_create(huddle_hash=huddle_hash)
+        # We fetch the recipient along with the huddle, so that the
+        # cached Huddle object carries it, and get_huddle_recipient
+        # doesn't need to do a database query on every cache hit.
+        (huddle, created) = Huddle.objects.select_related("recipient").get_or_create(
+            huddle_hash=huddle_hash
+        )
         if created:
             recipient = Recipient.objects.create(type_id=huddle.id, type=Recipient.HUDDLE)
             huddle.recipient = recipient
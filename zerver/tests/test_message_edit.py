@@ -96,9 +96,9 @@ class EditMessageTest(ZulipTestCase):
         # Check number of queries performed
         with queries_captured() as queries:
             MessageDict.to_dict_uncached(messages)
-        # 1 query for realm_id per message = 3
+        # 1 query for realm_id of all stream messages = 1
         # 1 query each for reactions & submessage for all messages = 2
-        self.assertEqual(len(queries), 5)
+        self.assertEqual(len(queries), 3)
 
         realm_id = 2  # Fetched from stream object
         # Check number of queries performed with realm_id
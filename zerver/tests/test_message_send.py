@@ -60,11 +60,13 @@ from zerver.models import (
     UserMessage,
     UserProfile,
     flush_per_request_caches,
+    get_huddle_hash,
     get_huddle_recipient,
     get_realm,
     get_stream,
     get_system_bot,
     get_user,
+    huddle_hash_cache_key,
 )
 from zerver.views.message_send import InvalidMirrorInput
 
@@ -605,6 +607,26 @@ class MessagePOSTTest(ZulipTestCase):
             ).id,
         )
 
+    def test_huddle_recipient_cached_with_huddle(self) -> None:
+        user_ids = {
+            self.example_user("hamlet").id,
+            self.example_user("othello").id,
+            self.example_user("cordelia").id,
+        }
+        recipient = get_huddle_recipient(user_ids)
+
+        # The huddle now exists in the database; drop it from the
+        # cache so that the next lookup goes through get_or_create.
+        cache_delete(huddle_hash_cache_key(get_huddle_hash(list(user_ids))))
+
+        self.assertEqual(get_huddle_recipient(user_ids).id, recipient.id)
+
+        # The cached Huddle carries its recipient, so a cache hit
+        # doesn't need any database queries.
+        with queries_captured() as queries:
+            self.assertEqual(get_huddle_recipient(user_ids).id, recipient.id)
+        self.assert_length(queries, 0)
+
     def test_personal_message_copying_self(self) -> None:
         """
         Sending a personal message to yourself plus another user is successful,
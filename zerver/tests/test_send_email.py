@@ -2,6 +2,8 @@ from django.core.mail.message import sanitize_address
 
 from zerver.lib.send_email import FromAddress, build_email
 from zerver.lib.test_classes import ZulipTestCase
+from zerver.lib.test_helpers import cache_tries_captured
+from zerver.models import UserProfile
 
 OVERLY_LONG_NAME = "Z̷̧̙̯͙̠͇̰̲̞̙͆́͐̅̌͐̔͑̚u̷̼͎̹̻̻̣̞͈̙͛͑̽̉̾̀̅̌͜͠͞ļ̛̫̻̫̰̪̩̠̣̼̏̅́͌̊͞į̴̛̛̩̜̜͕̘̂̑̀̈p̡̛͈͖͓̟͍̿͒̍̽͐͆͂̀ͅ A̰͉̹̅̽̑̕͜͟͡c̷͚̙̘̦̞̫̭͗̋͋̾̑͆̒͟͞c̵̗̹̣̲͚̳̳̮͋̈́̾̉̂͝ͅo̠̣̻̭̰͐́͛̄̂̿̏͊u̴̱̜̯̭̞̠͋͛͐̍̄n̸̡̘̦͕͓̬͌̂̎͊͐̎͌̕ť̮͎̯͎̣̙̺͚̱̌̀́̔͢͝ S͇̯̯̙̳̝͆̊̀͒͛̕ę̛̘̬̺͎͎́̔̊̀͂̓̆̕͢ͅc̨͎̼̯̩̽͒̀̏̄̌̚u̷͉̗͕̼̮͎̬͓͋̃̀͂̈̂̈͊͛ř̶̡͔̺̱̹͓̺́̃̑̉͡͞ͅi̶̺̭͈̬̞̓̒̃͆̅̿̀̄́t͔̹̪͔̥̣̙̍̍̍̉̑̏͑́̌ͅŷ̧̗͈͚̥̗͚͊͑̀͢͜͡"
 
@@ -57,3 +59,31 @@ class TestBuildEmail(ZulipTestCase):
             language="en",
         )
         self.assertEqual(mail.extra_headers["From"], FromAddress.NOREPLY)
+
+    def test_build_email_to_user_ids(self) -> None:
+        hamlet = self.example_user("hamlet")
+        cordelia = self.example_user("cordelia")
+        othello = self.example_user("othello")
+        with cache_tries_captured() as cache_tries:
+            mail = build_email(
+                "zerver/emails/password_reset",
+                to_user_ids=[hamlet.id, cordelia.id, othello.id],
+                from_address=FromAddress.NOREPLY,
+                language="en",
+            )
+        # All the recipients are fetched with a single cache round trip.
+        self.assert_length(cache_tries, 1)
+        self.assertEqual(cache_tries[0][0], "getmany")
+        self.assert_length(mail.to, 3)
+        self.assertIn(hamlet.delivery_email, mail.to[0])
+        self.assertIn(othello.delivery_email, mail.to[2])
+
+    def test_build_email_to_nonexistent_user_id(self) -> None:
+        hamlet = self.example_user("hamlet")
+        with self.assertRaises(UserProfile.DoesNotExist):
+            build_email(
+                "zerver/emails/password_reset",
+                to_user_ids=[hamlet.id, 999999],
+                from_address=FromAddress.NOREPLY,
+                language="en",
+            )
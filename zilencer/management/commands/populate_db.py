@@ -15,6 +15,7 @@ from django.db import connection
 from django.db.models import F, Max
 from django.utils.timezone import now as timezone_now
 from django.utils.timezone import timedelta as timezone_timedelta
+from psycopg2.sql import SQL, Identifier
 
 from scripts.lib.zulip_tools import get_or_create_dev_uuid_var_path
 from zerver.lib.actions import (
@@ -100,21 +101,32 @@ def clear_database() -> None:
             **default_cache["OPTIONS"],
         ).flush_all()
 
-    model: Any = None  # Hack because mypy doesn't know these are model classes
-    for model in [
-        Message,
-        Stream,
-        UserProfile,
-        Recipient,
-        Realm,
-        Subscription,
-        Huddle,
-        UserMessage,
-        Client,
-        DefaultStream,
-    ]:
-        model.objects.all().delete()
-    Session.objects.all().delete()
+    # A single TRUNCATE ... CASCADE is much faster than deleting each
+    # model via the ORM, which fetches every row into Python to run
+    # on_delete handlers and signals; CASCADE clears the tables that
+    # reference these via foreign keys, as the ORM deletion did.
+    tables = [
+        model._meta.db_table
+        for model in [
+            Message,
+            Stream,
+            UserProfile,
+            Recipient,
+            Realm,
+            Subscription,
+            Huddle,
+            UserMessage,
+            Client,
+            DefaultStream,
+            Session,
+        ]
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SQL("TRUNCATE TABLE {} CASCADE").format(
+                SQL(", ").join([Identifier(table) for table in tables])
+            )
+        )
 
 
 # Suppress spammy output from the push notifications logger